@@ -1,18 +1,32 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.responses import RedirectResponse
-from src.container import AppContainer
-from src.dependencies import get_search_use_case, get_search_by_link_use_case
+from src.config.settings import get_settings
+from src.dependencies import container
 from src.presentation.api.routes import router
+from src.presentation.api.responses import MsgspecJSONResponse
 import uvicorn
 import logging
+import os
 
 logging.basicConfig(level=logging.INFO)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.http = container.http_client().get_client()
+    yield
+    await app.state.http.aclose()
+    await container.cache_service().close()
+    container.reset_singletons()
+
 app = FastAPI(
     title="Wildberries API",
     description="API для парсинга данных с Wildberries",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=MsgspecJSONResponse,
+    lifespan=lifespan
 )
 
 @app.get("/", include_in_schema=False)
@@ -22,4 +36,14 @@ async def root():
 app.include_router(router, prefix="/api")
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    settings = get_settings()
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=settings.server_workers or os.cpu_count(),
+        limit_concurrency=settings.server_limit_concurrency,
+        backlog=settings.server_backlog
+    )
\ No newline at end of file
@@ -1,5 +1,6 @@
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from functools import lru_cache
+from typing import Optional
 
 class Settings(BaseSettings):
     wb_base_url: str = "https://search.wb.ru/exactmatch/ru/common/v9/search"
@@ -7,13 +8,30 @@ class Settings(BaseSettings):
     default_currency: str = "rub"
     default_destination: str = "12358062"
     http_timeout: float = 10.0
+    http_connect_timeout: float = 2.0
+    http_max_connections: int = 200
+    http_max_keepalive_connections: int = 100
+    http_keepalive_expiry: float = 30.0
+    search_concurrency: int = 10
+    supplier_concurrency: int = 5
     log_level: str = "INFO"
+    server_workers: Optional[int] = None
+    server_limit_concurrency: int = 1024
+    server_backlog: int = 2048
     redis_url: str = "redis://localhost:6379/0"
+    redis_max_connections: int = 64
+    redis_pool_timeout: float = 5.0
     cache_ttl: int = 1200
+    cache_lock_timeout: float = 30.0
+    cache_lock_poll_interval: float = 0.1
+    product_nm_cache_ttl: int = 604800
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        frozen=True,
+        extra="ignore"
+    )
 
 @lru_cache
 def get_settings() -> Settings:
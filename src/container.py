@@ -10,12 +10,12 @@ from .domain.use_cases.fetch_products_by_supplier import FetchProductsBySupplier
 from .domain.use_cases.fetch_ids_by_supplier import FetchIDsBySupplierUseCase
 
 class AppContainer(containers.DeclarativeContainer):
-    http_client = providers.Object(AsyncHTTPClient().get_client())
-    cache_service = providers.Factory(CacheService)
-    parser = providers.Factory(WBParser, http_client=http_client, cache_service=cache_service)
-    search_use_case = providers.Factory(SearchProductsUseCase, parser_repository=parser)
-    search_by_link_use_case = providers.Factory(SearchProductsByLinkUseCase, parser_repository=parser, search_use_case=search_use_case)
-    price_range_use_case = providers.Factory(PriceRangeUseCase, parser_repository=parser)
-    fetch_feedbacks_use_case = providers.Factory(FetchFeedbacksUseCase, parser_repository=parser)
-    fetch_products_by_supplier_use_case = providers.Factory(FetchProductsBySupplierUseCase, parser_repository=parser)
-    fetch_ids_by_supplier_use_case = providers.Factory(FetchIDsBySupplierUseCase, parser_repository=parser)
\ No newline at end of file
+    http_client = providers.Singleton(AsyncHTTPClient)
+    cache_service = providers.Singleton(CacheService)
+    parser = providers.Singleton(WBParser, http_client=http_client.provided.client, cache_service=cache_service)
+    search_use_case = providers.Singleton(SearchProductsUseCase, parser_repository=parser)
+    search_by_link_use_case = providers.Singleton(SearchProductsByLinkUseCase, parser_repository=parser, search_use_case=search_use_case)
+    price_range_use_case = providers.Singleton(PriceRangeUseCase, parser_repository=parser)
+    fetch_feedbacks_use_case = providers.Singleton(FetchFeedbacksUseCase, parser_repository=parser)
+    fetch_products_by_supplier_use_case = providers.Singleton(FetchProductsBySupplierUseCase, parser_repository=parser)
+    fetch_ids_by_supplier_use_case = providers.Singleton(FetchIDsBySupplierUseCase, parser_repository=parser)
\ No newline at end of file
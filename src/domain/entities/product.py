@@ -1,27 +1,22 @@
-from pydantic import BaseModel, HttpUrl
+import msgspec
 from typing import Optional, Dict, List
 from datetime import datetime
 
-class Product(BaseModel):
+class Product(msgspec.Struct, frozen=True, gc=False, kw_only=True):
     id: int
     name: str
     price: float
-    rating: Optional[float] = 0.0
-    link: HttpUrl
+    rating: float = 0.0
+    link: str
     feedbacks: int = 0
     subjectId: int = 0
     root: Optional[int] = None
 
-    class Config:
-        json_encoders = {
-            HttpUrl: str 
-        }
-
-class ProductResponse(BaseModel):
+class ProductResponse(msgspec.Struct):
     count: int
-    products: list[Product]
+    products: List[Product]
 
-class PriceRangeResponse(BaseModel):
+class PriceRangeResponse(msgspec.Struct):
     query: str
     min_price: float
     max_price: float
@@ -29,7 +24,7 @@ class PriceRangeResponse(BaseModel):
     total_products: int
     price_distribution: Optional[Dict[str, int]] = None
 
-class Feedback(BaseModel):
+class Feedback(msgspec.Struct, frozen=True, gc=False, kw_only=True):
     id: str
     text: str
     pros: str
@@ -39,6 +34,14 @@ class Feedback(BaseModel):
     user_name: Optional[str] = None
     product_nm: int
 
-class FeedbackResponse(BaseModel):
+class FeedbackResponse(msgspec.Struct):
     count: int
-    feedbacks: List[Feedback]
\ No newline at end of file
+    feedbacks: List[Feedback]
+
+class SupplierIDs(msgspec.Struct):
+    supplier_id: int
+    site_id: int
+
+ENC = msgspec.json.Encoder()
+PRODUCT_DEC = msgspec.json.Decoder(List[Product])
+FEEDBACK_DEC = msgspec.json.Decoder(List[Feedback])
@@ -1,5 +1,5 @@
-from typing import List
-from ..entities.product import Feedback, FeedbackResponse
+from typing import Optional
+from ..entities.product import SupplierIDs
 from ..interfaces.parser_repository import ParserRepository
 import logging
 
@@ -9,7 +9,10 @@ class FetchIDsBySupplierUseCase:
     def __init__(self, parser_repository: ParserRepository):
         self.parser_repository = parser_repository
 
-    async def execute(self, brand_url: str) -> FeedbackResponse:
+    async def execute(self, brand_url: str) -> Optional[SupplierIDs]:
         logger.info(f"Processing ids for link: {brand_url}")
-        supplier_id, site_id = await self.parser_repository.get_supplier_ids_by_brand_url(brand_url)
-        return {"supplier_id": supplier_id, "site_id": site_id}
\ No newline at end of file
+        result = await self.parser_repository.get_supplier_ids_by_brand_url(brand_url)
+        if result is None:
+            logger.warning(f"No supplier ids found for link: {brand_url}")
+            return None
+        return SupplierIDs(*result)
\ No newline at end of file
@@ -1,23 +1,17 @@
-from typing import Dict, List, Optional
+from typing import Dict, Optional
 from ..entities.product import Product, PriceRangeResponse
 from ..interfaces.parser_repository import ParserRepository
-from statistics import mean
+import numpy as np
 import logging
 
 logger = logging.getLogger(__name__)
 
-def calculate_price_distribution(prices: List[float]) -> Dict[str, int]:
-    max_price = max(prices)
-    step = (max_price + 100) / 5
-    distribution = {f"{i*step:.0f}-{(i+1)*step:.0f}": 0 for i in range(5)}
-
-    for price in prices:
-        for i in range(5):
-            if i * step <= price < (i + 1) * step:
-                distribution[f"{i*step:.0f}-{(i+1)*step:.0f}"] += 1
-                break
-
-    return distribution
+def calculate_price_distribution(prices: np.ndarray) -> Dict[str, int]:
+    step = (prices.max() + 100) / 5
+    keys = [f"{i*step:.0f}-{(i+1)*step:.0f}" for i in range(5)]
+    buckets = np.minimum((prices / step).astype(np.intp), 4)
+    counts = np.bincount(buckets, minlength=5)
+    return dict(zip(keys, counts.tolist()))
 
 class PriceRangeUseCase:
     def __init__(self, parser_repository: ParserRepository):
@@ -36,20 +30,14 @@ class PriceRangeUseCase:
                 total_products=0
             )
 
-        prices = [product.price for product in products]
-        min_price = min(prices)
-        max_price = max(prices)
-        avg_price = mean(prices)
-
-        price_distribution = None
-        if prices:
-            price_distribution = calculate_price_distribution(prices)
+        prices = np.fromiter((product.price for product in products), dtype=np.float64, count=len(products))
+        price_distribution = calculate_price_distribution(prices)
 
         return PriceRangeResponse(
             query=query,
-            min_price=min_price,
-            max_price=max_price,
-            avg_price=avg_price,
+            min_price=float(prices.min()),
+            max_price=float(prices.max()),
+            avg_price=float(prices.mean()),
             total_products=len(products),
             price_distribution=price_distribution
         )
\ No newline at end of file
@@ -2,6 +2,9 @@ from typing import Dict, List
 from ..entities.product import Product
 from ..interfaces.parser_repository import ParserRepository
 from .search_products import SearchProductsUseCase
+from operator import attrgetter
+import asyncio
+import heapq
 import logging
 import time
 
@@ -22,33 +25,35 @@ class SearchProductsByLinkUseCase:
 
         logger.info(f"Fetched product by link {link}, time: {time.time() - start_time:.2f}s")
 
-        cheap_products = await self.search_use_case.execute(product.name, sort="cheap", pages=pages)
-        expensive_products = await self.search_use_case.execute(product.name, sort="expensive", pages=pages)
+        cheap_products, expensive_products = await asyncio.gather(
+            self.search_use_case.execute(product.name, sort="cheap", pages=pages),
+            self.search_use_case.execute(product.name, sort="expensive", pages=pages)
+        )
         logger.info(f"Searched products for {product.name}, time: {time.time() - start_time:.2f}s")
 
-        all_products = list({p.id: p for p in cheap_products + expensive_products}.values())
+        seen_ids = set()
+        all_products = []
+        for p in cheap_products:
+            if p.id not in seen_ids:
+                seen_ids.add(p.id)
+                all_products.append(p)
+        for p in expensive_products:
+            if p.id not in seen_ids:
+                seen_ids.add(p.id)
+                all_products.append(p)
 
         min_price_threshold = product.price * 0.1  
         min_feedbacks = 0
 
-        better_price = [
+        candidates = [
             p for p in all_products
-            if p.price <= product.price
-            and p.price >= min_price_threshold
-            and p.feedbacks >= min_feedbacks
+            if p.id != product.id
             and p.subjectId == product.subjectId
-            and p.id != product.id
-        ]
-        better_rating = [
-            p for p in all_products
-            if p.rating >= product.rating
             and p.price >= min_price_threshold
             and p.feedbacks >= min_feedbacks
-            and p.subjectId == product.subjectId
-            and p.id != product.id
         ]
-        better_price = sorted(better_price, key=lambda x: x.price)[:3]
-        better_rating = sorted(better_rating, key=lambda x: x.rating, reverse=True)[:3]
+        better_price = heapq.nsmallest(3, (p for p in candidates if p.price <= product.price), key=attrgetter("price"))
+        better_rating = heapq.nlargest(3, (p for p in candidates if p.rating >= product.rating), key=attrgetter("rating"))
 
         logger.info(f"Processed results for link {link}, time: {time.time() - start_time:.2f}s")
         return {
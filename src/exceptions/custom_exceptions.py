@@ -1,3 +1,7 @@
+from typing import Optional
+
 class ParserError(Exception):
     """Custom exception for parser-related errors."""
-    pass
\ No newline at end of file
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
\ No newline at end of file
@@ -1,24 +1,80 @@
+import msgspec
 import redis.asyncio as redis
-from typing import Optional, TypeVar, Generic
-import json
+import xxhash
+from cachetools import TTLCache
+from typing import Awaitable, Callable, List, Optional, TypeVar, Generic, Type
+import asyncio
 import logging
+import uuid
 from ...config.settings import get_settings
-from ...domain.entities.product import Product
+from ...domain.entities.product import Product, Feedback, ENC, PRODUCT_DEC, FEEDBACK_DEC
 
 T = TypeVar("T")
 logger = logging.getLogger(__name__)
 
+_DECODERS = {Product: PRODUCT_DEC, Feedback: FEEDBACK_DEC}
+
+def _decoder(model: type) -> msgspec.json.Decoder:
+    decoder = _DECODERS.get(model)
+    if decoder is None:
+        decoder = _DECODERS[model] = msgspec.json.Decoder(List[model])
+    return decoder
+
+_settings = get_settings()
+_LOCAL_TTL = min(60, _settings.cache_ttl)
+_LOCK_TIMEOUT_MS = int(_settings.cache_lock_timeout * 1000)
+_LOCK_POLL_INTERVAL = _settings.cache_lock_poll_interval
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+_POOL = redis.BlockingConnectionPool.from_url(
+    _settings.redis_url,
+    max_connections=_settings.redis_max_connections,
+    timeout=_settings.redis_pool_timeout
+)
+
 class CacheService(Generic[T]):
     def __init__(self):
-        self.settings = get_settings()
-        self.client = redis.from_url(self.settings.redis_url)
+        self.client = redis.Redis(connection_pool=_POOL)
+        self._local = TTLCache(maxsize=1024, ttl=_LOCAL_TTL)
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._lock_users: dict[str, int] = {}
+        self._inflight: dict[str, asyncio.Task] = {}
+
+    @staticmethod
+    def make_key(namespace: str, *parts: object) -> str:
+        digest = xxhash.xxh3_64_hexdigest("|".join(map(str, parts)).encode())
+        return f"{namespace}:{digest}"
 
-    async def get(self, key: str) -> Optional[list[Product]]:
+    async def get(self, key: str, model: Type[T] = Product) -> Optional[list[T]]:
+        cached_value = self._local.get(key)
+        if cached_value is not None:
+            return cached_value
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        self._lock_users[key] = self._lock_users.get(key, 0) + 1
+        try:
+            async with lock:
+                cached_value = self._local.get(key)
+                if cached_value is not None:
+                    return cached_value
+                return await self._get_remote(key, model)
+        finally:
+            self._lock_users[key] -= 1
+            if not self._lock_users[key]:
+                del self._lock_users[key]
+                del self._locks[key]
+
+    async def _get_remote(self, key: str, model: Type[T]) -> Optional[list[T]]:
         try:
             cached_data = await self.client.get(key)
             if cached_data:
-                data = json.loads(cached_data)
-                return [Product(**item) for item in data]
+                value = _decoder(model).decode(cached_data)
+                self._local[key] = value
+                return value
             return None
         except redis.RedisError as e:
             logger.error(f"Redis unavailable for key {key}: {e}")
@@ -27,15 +83,111 @@ class CacheService(Generic[T]):
             logger.error(f"Cache get error for key {key}: {e}")
             return None
 
-    async def set(self, key: str, value: list[Product], ttl: int) -> None:
+    async def set(self, key: str, value: list[T], ttl: int) -> None:
         try:
-            serialized_value = [product.dict() for product in value]
-            await self.client.setex(key, ttl, json.dumps(serialized_value, default=str))
+            await self.client.setex(key, ttl, ENC.encode(value))
+            self._local[key] = value
         except redis.RedisError as e:
+            self._local.pop(key, None)
             logger.error(f"Redis unavailable for key {key}: {e}")
         except Exception as e:
+            self._local.pop(key, None)
             logger.error(f"Cache set error for key {key}: {e}")
             raise
 
+    async def get_or_set(self, key: str, loader: Callable[[], Awaitable[list[T]]], ttl: int, model: Type[T] = Product) -> list[T]:
+        cached_value = await self.get(key, model=model)
+        if cached_value:
+            logger.info(f"Cache hit for key: {key}")
+            return cached_value
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._load_single_flight(key, loader, ttl, model))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _load_single_flight(self, key: str, loader: Callable[[], Awaitable[list[T]]], ttl: int, model: Type[T]) -> list[T]:
+        lock_key = f"{key}:lock"
+        token = uuid.uuid4().hex
+        acquired = await self._acquire_lock(lock_key, token)
+        if not acquired:
+            cached_value = await self._wait_for_value(key, lock_key, model)
+            if cached_value:
+                logger.info(f"Cache filled by another worker for key: {key}")
+                return cached_value
+
+        try:
+            value = await loader()
+        except BaseException:
+            if acquired:
+                await self._release_lock(lock_key, token)
+            raise
+
+        if acquired:
+            await self._set_and_release_lock(key, value, ttl, lock_key, token)
+        elif value:
+            await self.set(key, value, ttl)
+        return value
+
+    async def _set_and_release_lock(self, key: str, value: list[T], ttl: int, lock_key: str, token: str) -> None:
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                if value:
+                    pipe.setex(key, ttl, ENC.encode(value))
+                pipe.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+                await pipe.execute()
+            if value:
+                self._local[key] = value
+                logger.info(f"Cache set successfully for key: {key}")
+        except redis.RedisError as e:
+            self._local.pop(key, None)
+            logger.error(f"Redis unavailable for key {key}: {e}")
+
+    async def _acquire_lock(self, lock_key: str, token: str) -> bool:
+        try:
+            return bool(await self.client.set(lock_key, token, nx=True, px=_LOCK_TIMEOUT_MS))
+        except redis.RedisError as e:
+            logger.error(f"Redis unavailable for lock {lock_key}: {e}")
+            return True
+
+    async def _release_lock(self, lock_key: str, token: str) -> None:
+        try:
+            await self.client.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+        except redis.RedisError as e:
+            logger.error(f"Redis unavailable for lock {lock_key}: {e}")
+
+    async def _wait_for_value(self, key: str, lock_key: str, model: Type[T]) -> Optional[list[T]]:
+        deadline = asyncio.get_running_loop().time() + _LOCK_TIMEOUT_MS / 1000
+        while asyncio.get_running_loop().time() < deadline:
+            await asyncio.sleep(_LOCK_POLL_INTERVAL)
+            try:
+                async with self.client.pipeline(transaction=False) as pipe:
+                    pipe.get(key)
+                    pipe.exists(lock_key)
+                    cached_data, lock_held = await pipe.execute()
+            except redis.RedisError as e:
+                logger.error(f"Redis unavailable while waiting for key {key}: {e}")
+                return None
+            if cached_data:
+                try:
+                    value = self._local[key] = _decoder(model).decode(cached_data)
+                    return value
+                except Exception as e:
+                    logger.error(f"Cache get error for key {key}: {e}")
+                    return None
+            if not lock_held:
+                return None
+        return None
+
+    async def delete(self, key: str) -> None:
+        self._local.pop(key, None)
+        try:
+            await self.client.delete(key)
+        except redis.RedisError as e:
+            logger.error(f"Redis unavailable for key {key}: {e}")
+
     async def close(self) -> None:
-        await self.client.aclose()
\ No newline at end of file
+        await self.client.aclose()
+        await _POOL.disconnect()
@@ -0,0 +1,83 @@
+import asyncio
+import httpx
+import logging
+import weakref
+
+logger = logging.getLogger(__name__)
+
+class AdmissionSession:
+    def __init__(self, controller: "AdmissionController"):
+        self._controller = controller
+        self.active = 0
+        self._condition = asyncio.Condition()
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.release()
+
+    async def acquire(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.active < self._controller.capacity)
+            self.active += 1
+            self._controller.active += 1
+
+    async def release(self) -> None:
+        async with self._condition:
+            self.active -= 1
+            self._controller.active -= 1
+            self._condition.notify(1)
+
+    async def _wake(self) -> None:
+        async with self._condition:
+            self._condition.notify_all()
+
+class AdmissionController:
+    def __init__(self, max_capacity: int):
+        self.max_capacity = max_capacity
+        self.capacity = max_capacity
+        self.active = 0
+        self._successes = 0
+        self._stale = 0
+        self._sessions: "weakref.WeakSet[AdmissionSession]" = weakref.WeakSet()
+
+    def session(self) -> AdmissionSession:
+        session = AdmissionSession(self)
+        self._sessions.add(session)
+        return session
+
+    async def resize(self, capacity: int) -> None:
+        capacity = max(1, min(capacity, self.max_capacity))
+        if capacity == self.capacity:
+            return
+        grew = capacity > self.capacity
+        self.capacity = capacity
+        if grew:
+            for session in list(self._sessions):
+                await session._wake()
+        logger.info(f"Admission capacity resized to {capacity}")
+
+    async def observe(self, response: httpx.Response) -> None:
+        if self._stale > 0:
+            self._stale -= 1
+            return
+
+        if response.status_code == 429:
+            await self._decrease(self.capacity // 2)
+            return
+
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        if remaining is not None and remaining.isdigit() and int(remaining) < self.capacity:
+            await self._decrease(int(remaining))
+        elif response.is_success and self.capacity < self.max_capacity:
+            self._successes += 1
+            if self._successes >= self.capacity:
+                self._successes = 0
+                await self.resize(self.capacity + 1)
+
+    async def _decrease(self, capacity: int) -> None:
+        self._successes = 0
+        self._stale = max(0, self.active - 1)
+        await self.resize(capacity)
@@ -4,7 +4,15 @@ from ...config.settings import get_settings
 class AsyncHTTPClient:
     def __init__(self):
         self.settings = get_settings()
-        self.client = httpx.AsyncClient(timeout=self.settings.http_timeout)
+        self.client = httpx.AsyncClient(
+            timeout=httpx.Timeout(self.settings.http_timeout, connect=self.settings.http_connect_timeout),
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=self.settings.http_max_connections,
+                max_keepalive_connections=self.settings.http_max_keepalive_connections,
+                keepalive_expiry=self.settings.http_keepalive_expiry
+            )
+        )
 
     async def __aenter__(self):
         return self.client
@@ -1,79 +1,89 @@
 import httpx
-from typing import List, Optional, Tuple
+import msgspec
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 from ...domain.entities.product import Product, Feedback
 from ...domain.interfaces.parser_repository import ParserRepository
 from ...exceptions.custom_exceptions import ParserError
 from ...config.settings import get_settings
 from ..cache.redis_cache import CacheService
+from ..http_client.admission_controller import AdmissionController
 import logging
-import hashlib
 import re
+import math
+import random
 import asyncio
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+_PRODUCT_ID_RE = re.compile(r"/catalog/(\d+)/detail\.aspx")
+_BRAND_RE = re.compile(r"/brands/([^/]+)/all")
+
+class _WBPrice(msgspec.Struct):
+    product: Optional[float] = None
+    total: Optional[float] = None
+
+class _WBSize(msgspec.Struct):
+    price: Optional[_WBPrice] = None
+
+class _WBProduct(msgspec.Struct):
+    id: Optional[int] = None
+    root: Optional[int] = None
+    name: Optional[str] = None
+    subjectId: Optional[int] = None
+    feedbacks: Optional[int] = None
+    reviewRating: Optional[float] = None
+    nmReviewRating: Optional[float] = None
+    rating: Optional[float] = None
+    sizes: Optional[List[Optional[_WBSize]]] = None
+
+class _WBData(msgspec.Struct):
+    products: Optional[List[_WBProduct]] = None
+
+class _WBCatalog(msgspec.Struct):
+    products: Optional[List[_WBProduct]] = None
+    data: Optional[_WBData] = None
+
+_CATALOG_DEC = msgspec.json.Decoder(_WBCatalog)
+
 class WBParser(ParserRepository):
     def __init__(self, http_client: httpx.AsyncClient, cache_service: CacheService):
         self.settings = get_settings()
         self.http_client = http_client
         self.cache_service = cache_service
+        self.search_admission = AdmissionController(self.settings.search_concurrency)
+        self.supplier_admission = AdmissionController(self.settings.supplier_concurrency)
 
     async def search_products(self, query: str, sort: str, pages: int) -> List[Product]:
         cache_key = self._generate_cache_key(query, sort, pages)
-        cached_products = await self.cache_service.get(cache_key)
-        
-        if cached_products:
-            logger.info(f"Cache hit for key: {cache_key}")
-            return cached_products
+        return await self.cache_service.get_or_set(
+            cache_key,
+            lambda: self._search_products(query, sort, pages),
+            self._jitter(self.settings.cache_ttl)
+        )
 
+    async def _search_products(self, query: str, sort: str, pages: int) -> List[Product]:
         sort_param = "priceup" if sort == "cheap" else "pricedown"
-        all_products = []
         max_pages = min(pages, self.settings.max_pages)
 
-        semaphore = asyncio.Semaphore(10) 
+        async def fetch_page(page: int) -> List[Product]:
+            retries = 3
 
-        async def fetch_page_with_semaphore(page: int) -> Optional[List[Product]]:
-            async with semaphore:
+            for attempt in range(retries):
                 try:
                     products = await self._fetch_page(query, sort_param, page)
                     logger.info(f"Fetched {len(products)} products for query {query}, page {page}")
                     return products
                 except ParserError as e:
-                    logger.error(f"Failed to fetch page {page}: {e}")
-                    return []
-
-        for batch_start in range(1, max_pages + 1, 10):
-            batch_end = min(batch_start + 9, max_pages + 1)
-            tasks = [
-                asyncio.ensure_future(fetch_page_with_semaphore(page))
-                for page in range(batch_start, batch_end)
-            ]
-            completed, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
-
-            for task in completed:
-                page = batch_start + tasks.index(task)
-                result = task.result()
-                if isinstance(result, list):
-                    if not result:
-                        logger.info(f"Empty page {page} for query {query}, stopping further parsing")
-                        for pending_task in pending:
-                            pending_task.cancel()
-                        await asyncio.gather(*pending, return_exceptions=True)
-                        sorted_products = sorted(all_products, key=lambda x: x.rating, reverse=True)
-                        await self.cache_service.set(cache_key, sorted_products, self.settings.cache_ttl)
-                        logger.info(f"Cache set successfully for key: {cache_key}")
-                        return sorted_products
-                    all_products.extend(result)
-                else:
-                    logger.error(f"Error in page {page} fetch: {result}")
-            if pending:
-                await asyncio.gather(*pending, return_exceptions=True)
-
-        sorted_products = sorted(all_products, key=lambda x: x.rating, reverse=True)
-        await self.cache_service.set(cache_key, sorted_products, self.settings.cache_ttl)
-        logger.info(f"Cache set successfully for key: {cache_key}")
-        return sorted_products
+                    if e.status_code != 429 or attempt == retries - 1:
+                        logger.error(f"Failed to fetch page {page}: {e}")
+                        return []
+                    logger.warning(f"Throttled on page {page} for query {query}, attempt {attempt + 1}")
+                    await asyncio.sleep(self._backoff(attempt))
+            return []
+
+        all_products = await self._fetch_pages(fetch_page, max_pages, self.search_admission, f"query {query}")
+        return sorted(all_products, key=lambda x: x.rating, reverse=True)
 
     async def get_product_by_link(self, link: str) -> Optional[Product]:
         cache_key = self._generate_cache_key_for_link(link)
@@ -83,7 +93,7 @@ class WBParser(ParserRepository):
             logger.info(f"Cache hit for key: {cache_key}")
             if not cached_product[0].root:
                 logger.warning(f"Cached product for {link} has no root, clearing cache")
-                await self.cache_service.client.delete(cache_key)
+                await self.cache_service.delete(cache_key)
             else:
                 return cached_product[0]
         logger.info(f"Cache miss for key: {cache_key}")
@@ -108,12 +118,12 @@ class WBParser(ParserRepository):
             logger.info(f"Sending request to {url} with params: {params}")
             response = await self.http_client.get(url, params=params)
             response.raise_for_status()
-            response_json = response.json()
-            logger.debug(f"API response for link {link}: {response_json}")
-            products = self._parse_products(response_json)
+            catalog = _CATALOG_DEC.decode(response.content)
+            logger.debug("API response for link %s: %s", link, catalog)
+            products = self._parse_products(catalog)
 
             if not products:
-                logger.error(f"No product found for link: {link}, response: {response_json}")
+                logger.error(f"No product found for link: {link}, response: {catalog}")
                 raise ParserError(f"No product found for link: {link}")
 
             product = products[0]
@@ -121,7 +131,7 @@ class WBParser(ParserRepository):
                 logger.error(f"No root field in product data for link: {link}")
                 raise ParserError(f"No product_nm found for link: {link}")
             
-            await self.cache_service.set(cache_key, [product], self.settings.cache_ttl)
+            await self.cache_service.set(cache_key, [product], self._jitter(self.settings.cache_ttl))
             logger.info(f"Cache set successfully for key: {cache_key}")
             return product
 
@@ -133,50 +143,51 @@ class WBParser(ParserRepository):
             raise ParserError(f"Failed to parse product: {e}")
 
     async def get_feedbacks(self, link: str) -> List[Feedback]:
+        product_nm = await self._get_product_nm(link)
+        cache_key = self._generate_cache_key_for_feedbacks(product_nm)
+        return await self.cache_service.get_or_set(
+            cache_key,
+            lambda: self._get_feedbacks(product_nm),
+            self._jitter(self.settings.cache_ttl),
+            model=Feedback
+        )
+
+    async def _get_product_nm(self, link: str) -> int:
+        nm_key = self._generate_cache_key_for_nm(link)
+        cached_nm = await self.cache_service.get(nm_key, model=int)
+        if cached_nm:
+            return cached_nm[0]
+
         product = await self.get_product_by_link(link)
         if not product or not product.root:
             logger.error(f"Failed to extract product_nm from link: {link}")
             raise ParserError(f"Failed to extract product_nm from link: {link}")
 
-        product_nm = product.root
-        cache_key = self._generate_cache_key_for_feedbacks(product_nm)
-        cached_feedbacks = await self.cache_service.get(cache_key, model=Feedback)
-        
-        if cached_feedbacks:
-            logger.info(f"Cache hit for feedback key: {cache_key}")
-            return cached_feedbacks
+        await self.cache_service.set(nm_key, [product.root], self.settings.product_nm_cache_ttl)
+        return product.root
 
-        all_feedbacks = []
-        page = 1
-        max_pages = 100  
+    async def _get_feedbacks(self, product_nm: int) -> List[Feedback]:
+        max_pages = 100
+        semaphore = asyncio.Semaphore(10)
+
+        async def fetch_page_with_semaphore(page: int) -> List[Feedback]:
+            async with semaphore:
+                feedbacks, _ = await self._fetch_feedback_page(product_nm, page)
+                return feedbacks
 
         try:
-            while True:
-                url = f"https://feedbacks2.wb.ru/feedbacks/v2/{product_nm}?page={page}"
-                logger.info(f"Sending request to {url}")
-                response = await self.http_client.get(url)
-                response.raise_for_status()
-                response_json = response.json()
-                logger.debug(f"API response for feedbacks product_nm {product_nm}, page {page}: {response_json}")
-
-                feedbacks = self._parse_feedbacks(response_json, product_nm)
-                if not feedbacks:
-                    logger.info(f"No more feedbacks found for product_nm {product_nm} on page {page}")
-                    break
-
-                all_feedbacks.extend(feedbacks)
-                page += 1
-
-                feedback_count = response_json.get("feedbackCount", 0)
-                if len(all_feedbacks) >= feedback_count or page > max_pages:
-                    break
+            all_feedbacks, feedback_count = await self._fetch_feedback_page(product_nm, 1)
+            if all_feedbacks:
+                total_pages = min(max_pages, math.ceil(feedback_count / len(all_feedbacks)))
+                pages = await asyncio.gather(*(
+                    fetch_page_with_semaphore(page)
+                    for page in range(2, total_pages + 1)
+                ))
+                for feedbacks in pages:
+                    all_feedbacks.extend(feedbacks)
 
             if not all_feedbacks:
                 logger.info(f"No feedbacks found for product_nm: {product_nm}")
-                return []
-
-            await self.cache_service.set(cache_key, all_feedbacks, self.settings.cache_ttl)
-            logger.info(f"Cache set successfully for feedback key: {cache_key}")
             return all_feedbacks
 
         except httpx.HTTPStatusError as e:
@@ -188,69 +199,38 @@ class WBParser(ParserRepository):
 
     async def get_products_by_supplier_id(self, supplier_id: int, pages: int) -> List[Product]:
         cache_key = self._generate_cache_key_for_supplier(supplier_id, pages)
-        cached_products = await self.cache_service.get(cache_key)
-        
-        if cached_products:
-            logger.info(f"Cache hit for key: {cache_key}")
-            return cached_products
+        return await self.cache_service.get_or_set(
+            cache_key,
+            lambda: self._get_products_by_supplier_id(supplier_id, pages),
+            self._jitter(self.settings.cache_ttl)
+        )
 
-        all_products = []
+    async def _get_products_by_supplier_id(self, supplier_id: int, pages: int) -> List[Product]:
         max_pages = min(pages, self.settings.max_pages)
 
-        semaphore = asyncio.Semaphore(5)
+        async def fetch_page(page: int) -> List[Product]:
+            retries = 10
+            last_exception = None
 
-        async def fetch_page_with_semaphore(page: int) -> Optional[List[Product]]:
-            async with semaphore:
-                retries = 30
-                last_exception = None
-                
-                for attempt in range(retries):
-                    try:
-                        products = await self._fetch_supplier_page(supplier_id, page)
-                        logger.info(f"Fetched {len(products)} products for supplier {supplier_id}, page {page}")
-                        await asyncio.sleep(0.6)  
-                        return products
-                    except ParserError as e:
-                        last_exception = e
-                        logger.warning(f"Attempt {attempt + 1} failed for page {page}: {e}")
-                        if attempt < retries - 1:
-                            await asyncio.sleep(0.6 * (attempt + 1))
-                        continue
-                
-                logger.error(f"All retries failed for supplier page {page}: {last_exception}")
-                return []
-
-        for batch_start in range(1, max_pages + 1, 10):
-            batch_end = min(batch_start + 9, max_pages + 1)
-            tasks = [
-                asyncio.ensure_future(fetch_page_with_semaphore(page))
-                for page in range(batch_start, batch_end)
-            ]
-            completed, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
-
-            for task in completed:
-                page = batch_start + tasks.index(task)
-                result = task.result()
-                if isinstance(result, list):
-                    if not result:
-                        logger.info(f"Empty page {page} for supplier {supplier_id}, stopping further parsing")
-                        for pending_task in pending:
-                            pending_task.cancel()
-                        await asyncio.gather(*pending, return_exceptions=True)
-                        sorted_products = sorted(all_products, key=lambda x: x.rating, reverse=True)
-                        await self.cache_service.set(cache_key, sorted_products, self.settings.cache_ttl)
-                        logger.info(f"Cache set successfully for supplier key: {cache_key}")
-                        return sorted_products
-                    all_products.extend(result)
-                else:
-                    logger.error(f"Error in supplier page {page} fetch: {result}")
-            if pending:
-                await asyncio.gather(*pending, return_exceptions=True)
-
-        sorted_products = sorted(all_products, key=lambda x: x.rating, reverse=True)
-        await self.cache_service.set(cache_key, sorted_products, self.settings.cache_ttl)
-        logger.info(f"Cache set successfully for supplier key: {cache_key}")
-        return sorted_products
+            for attempt in range(retries):
+                try:
+                    products = await self._fetch_supplier_page(supplier_id, page)
+                    logger.info(f"Fetched {len(products)} products for supplier {supplier_id}, page {page}")
+                    return products
+                except ParserError as e:
+                    last_exception = e
+                    if not self._is_retryable(e):
+                        logger.error(f"Non-retryable error for supplier page {page}: {e}")
+                        return []
+                    logger.warning(f"Attempt {attempt + 1} failed for page {page}: {e}")
+                    if attempt < retries - 1:
+                        await asyncio.sleep(self._backoff(attempt))
+
+            logger.error(f"All retries failed for supplier page {page}: {last_exception}")
+            return []
+
+        all_products = await self._fetch_pages(fetch_page, max_pages, self.supplier_admission, f"supplier {supplier_id}")
+        return sorted(all_products, key=lambda x: x.rating, reverse=True)
 
     async def get_supplier_ids_by_brand_url(self, brand_url: str) -> Optional[Tuple[int, int]]:
         brand_name = self._extract_brand_name(brand_url)
@@ -270,8 +250,8 @@ class WBParser(ParserRepository):
             logger.info(f"Sending request to {url}")
             response = await self.http_client.get(url)
             response.raise_for_status()
-            response_json = response.json()
-            logger.debug(f"API response for brand {brand_name}: {response_json}")
+            response_json = msgspec.json.decode(response.content)
+            logger.debug("API response for brand %s: %s", brand_name, response_json)
 
             supplier_id = response_json.get("id")
             site_id = response_json.get("siteId")
@@ -279,7 +259,7 @@ class WBParser(ParserRepository):
                 logger.error(f"No supplier ID or site ID found for brand: {brand_name}")
                 raise ParserError(f"No supplier ID or site ID found for brand: {brand_name}")
 
-            #await self.cache_service.set(cache_key, [{"id": supplier_id, "siteId": site_id}], self.settings.cache_ttl)
+            #await self.cache_service.set(cache_key, [{"id": supplier_id, "siteId": site_id}], self._jitter(self.settings.cache_ttl))
             #logger.info(f"Cache set successfully for brand key: {cache_key}")
             return (supplier_id, site_id)
 
@@ -290,32 +270,71 @@ class WBParser(ParserRepository):
             logger.error(f"Parsing error for brand {brand_name}: {e}")
             raise ParserError(f"Failed to parse brand data: {e}")
 
+    async def _fetch_pages(
+        self,
+        fetch_page: Callable[[int], Awaitable[List[Product]]],
+        max_pages: int,
+        admission: AdmissionController,
+        source: str
+    ) -> List[Product]:
+        session = admission.session()
+        next_pages = iter(range(1, max_pages + 1))
+        stop = asyncio.Event()
+        results: Dict[int, List[Product]] = {}
+
+        async def worker() -> None:
+            for page in next_pages:
+                if stop.is_set():
+                    return
+                async with session:
+                    products = await fetch_page(page)
+                if not products:
+                    logger.info(f"Empty page {page} for {source}, stopping further parsing")
+                    stop.set()
+                    return
+                results[page] = products
+
+        await asyncio.gather(*(worker() for _ in range(min(admission.max_capacity, max_pages))))
+        return [product for page in sorted(results) for product in results[page]]
+
+    @staticmethod
+    def _is_retryable(error: ParserError) -> bool:
+        if error.status_code is None:
+            return isinstance(error.__cause__, httpx.TransportError)
+        return error.status_code == 429 or error.status_code >= 500
+
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        return min(30.0, 0.5 * 2 ** attempt) * (0.5 + random.random())
+
+    @staticmethod
+    def _jitter(ttl: int) -> int:
+        return int(ttl * (0.9 + 0.2 * random.random()))
+
     def _generate_cache_key(self, query: str, sort: str, pages: int) -> str:
-        key = f"wb:search:{query}:{sort}:{pages}"
-        return hashlib.md5(key.encode()).hexdigest()
+        return self.cache_service.make_key("wb:search", query, sort, pages)
 
     def _generate_cache_key_for_link(self, link: str) -> str:
-        key = f"wb:product:{link}"
-        return hashlib.md5(key.encode()).hexdigest()
+        return self.cache_service.make_key("wb:product", link)
+
+    def _generate_cache_key_for_nm(self, link: str) -> str:
+        return self.cache_service.make_key("wb:nm", link)
 
     def _generate_cache_key_for_feedbacks(self, product_nm: int) -> str:
-        key = f"wb:feedbacks:{product_nm}"
-        return hashlib.md5(key.encode()).hexdigest()
+        return self.cache_service.make_key("wb:feedbacks", product_nm)
 
     def _generate_cache_key_for_supplier(self, supplier_id: int, pages: int) -> str:
-        key = f"wb:supplier:{supplier_id}:{pages}"
-        return hashlib.md5(key.encode()).hexdigest()
+        return self.cache_service.make_key("wb:supplier", supplier_id, pages)
 
     def _generate_cache_key_for_brand(self, brand_name: str) -> str:
-        key = f"wb:brand:{brand_name}"
-        return hashlib.md5(key.encode()).hexdigest()
+        return self.cache_service.make_key("wb:brand", brand_name)
 
     def _extract_product_id(self, link: str) -> Optional[str]:
-        match = re.search(r"/catalog/(\d+)/detail\.aspx", link)
+        match = _PRODUCT_ID_RE.search(link)
         return match.group(1) if match else None
 
     def _extract_brand_name(self, brand_url: str) -> Optional[str]:
-        match = re.search(r"/brands/([^/]+)/all", brand_url)
+        match = _BRAND_RE.search(brand_url)
         return match.group(1) if match else None
 
     async def _fetch_page(self, query: str, sort: str, page: int) -> Optional[List[Product]]:
@@ -334,17 +353,27 @@ class WBParser(ParserRepository):
                 "suppressSpellcheck": "false"
             }
             response = await self.http_client.get(self.settings.wb_base_url, params=params)
+            await self.search_admission.observe(response)
             response.raise_for_status()
-            response_json = response.json()
-            logger.debug(f"API response for search query {query}, page {page}: {response_json}")
-            return self._parse_products(response_json)
+            catalog = _CATALOG_DEC.decode(response.content)
+            logger.debug("API response for search query %s, page %s: %s", query, page, catalog)
+            return self._parse_products(catalog)
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error on page {page}: {e}")
-            raise ParserError(f"Failed to fetch page {page}: {e}")
+            raise ParserError(f"Failed to fetch page {page}: {e}", status_code=e.response.status_code)
         except Exception as e:
             logger.error(f"Parsing error on page {page}: {e}")
             raise ParserError(f"Failed to parse page {page}: {e}")
 
+    async def _fetch_feedback_page(self, product_nm: int, page: int) -> Tuple[List[Feedback], int]:
+        url = f"https://feedbacks2.wb.ru/feedbacks/v2/{product_nm}?page={page}"
+        logger.info(f"Sending request to {url}")
+        response = await self.http_client.get(url)
+        response.raise_for_status()
+        response_json = msgspec.json.decode(response.content)
+        logger.debug("API response for feedbacks product_nm %s, page %s: %s", product_nm, page, response_json)
+        return self._parse_feedbacks(response_json, product_nm), response_json.get("feedbackCount", 0)
+
     async def _fetch_supplier_page(self, supplier_id: int, page: int) -> Optional[List[Product]]:
         try:
             params = {
@@ -362,43 +391,48 @@ class WBParser(ParserRepository):
             url = "https://catalog.wb.ru/brands/v4/catalog"
             logger.info(f"Sending request to {url} with params: {params}")
             response = await self.http_client.get(url, params=params)
+            await self.supplier_admission.observe(response)
             response.raise_for_status()
-            response_json = response.json()
-            logger.debug(f"API response for supplier {supplier_id}, page {page}: {response_json}")
-            return self._parse_products(response_json)
+            catalog = _CATALOG_DEC.decode(response.content)
+            logger.debug("API response for supplier %s, page %s: %s", supplier_id, page, catalog)
+            return self._parse_products(catalog)
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error for supplier {supplier_id}, page {page}: {e}")
-            raise ParserError(f"Failed to fetch supplier page {page}: {e}")
+            raise ParserError(f"Failed to fetch supplier page {page}: {e}", status_code=e.response.status_code)
+        except httpx.TransportError as e:
+            logger.error(f"Transport error for supplier {supplier_id}, page {page}: {e}")
+            raise ParserError(f"Failed to fetch supplier page {page}: {e}") from e
         except Exception as e:
             logger.error(f"Parsing error for supplier {supplier_id}, page {page}: {e}")
             raise ParserError(f"Failed to parse supplier page {page}: {e}")
 
-    def _parse_products(self, data: dict) -> List[Product]:
+    def _parse_products(self, catalog: _WBCatalog) -> List[Product]:
+        items = catalog.products
+        if items is None and catalog.data is not None:
+            items = catalog.data.products
+        if not items:
+            return []
+
         products = []
-        data_products = data.get("products", data.get("data", {}).get("products", []))
-        if not isinstance(data_products, list):
-            logger.error(f"Unexpected products format: {data_products}")
-            return products
-
-        for item in data_products:
-            price_data = item.get("sizes", [{}])[0].get("price", {})
-            price = price_data.get("product", price_data.get("total", 0)) / 100
-            product_id = item.get("id")
+        products_append = products.append
+        for item in items:
+            product_id = item.id
             if not product_id:
                 logger.warning(f"Skipping item without id: {item}")
                 continue
-            product_nm = item.get("root", product_id)
-            product_link = f"https://www.wildberries.ru/catalog/{product_id}/detail.aspx"
+            size = item.sizes[0] if item.sizes else None
+            price_data = (size.price if size is not None else None) or _WBPrice()
+            price = (price_data.product or price_data.total or 0) / 100.0
 
-            products.append(Product(
+            products_append(Product(
                 id=product_id,
-                name=item.get("name", "Unknown"),
+                name=item.name or "Unknown",
                 price=price,
-                rating=item.get("reviewRating", item.get("nmReviewRating", item.get("rating", 0.0))),
-                link=product_link,
-                feedbacks=item.get("feedbacks", 0),
-                subjectId=item.get("subjectId", 0),
-                root=product_nm
+                rating=item.reviewRating or item.nmReviewRating or item.rating or 0.0,
+                link=f"https://www.wildberries.ru/catalog/{product_id}/detail.aspx",
+                feedbacks=item.feedbacks or 0,
+                subjectId=item.subjectId or 0,
+                root=item.root or product_id
             ))
         return products
 
@@ -409,20 +443,23 @@ class WBParser(ParserRepository):
             logger.error(f"Unexpected feedbacks format: {feedback_data}")
             return feedbacks
 
+        feedbacks_append = feedbacks.append
+        fromisoformat = datetime.fromisoformat
         for item in feedback_data:
-            feedback_id = item.get("id")
+            get = item.get
+            feedback_id = get("id")
             if not feedback_id:
                 logger.warning(f"Skipping feedback without id: {item}")
                 continue
 
-            feedbacks.append(Feedback(
+            feedbacks_append(Feedback(
                 id=feedback_id,
-                text=item.get("text", ""),
-                pros=item.get("pros", ""),
-                cons=item.get("cons", ""),
-                rating=item.get("productValuation", 0),
-                created_date=datetime.fromisoformat(item.get("createdDate", "1970-01-01T00:00:00Z")),
-                user_name=item.get("wbUserDetails", {}).get("name"),
+                text=get("text", ""),
+                pros=get("pros", ""),
+                cons=get("cons", ""),
+                rating=get("productValuation", 0),
+                created_date=fromisoformat(get("createdDate", "1970-01-01T00:00:00Z")),
+                user_name=(get("wbUserDetails") or {}).get("name"),
                 product_nm=product_nm
             ))
         return feedbacks
\ No newline at end of file
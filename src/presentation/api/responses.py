@@ -0,0 +1,22 @@
+from typing import Any
+import msgspec
+from fastapi.responses import JSONResponse
+from ...domain.entities.product import ENC
+
+class MsgspecJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return ENC.encode(content)
+
+def _inline_refs(schema: Any, components: dict) -> Any:
+    if isinstance(schema, dict):
+        ref = schema.get("$ref")
+        if ref is not None:
+            return _inline_refs(components[ref], components)
+        return {key: _inline_refs(value, components) for key, value in schema.items()}
+    if isinstance(schema, list):
+        return [_inline_refs(value, components) for value in schema]
+    return schema
+
+def msgspec_responses(model: Any) -> dict:
+    (schema,), components = msgspec.json.schema_components([model], ref_template="{name}")
+    return {200: {"content": {"application/json": {"schema": _inline_refs(schema, components)}}}}
@@ -1,5 +1,6 @@
-from fastapi import APIRouter, Query, Depends
-from ...domain.entities.product import ProductResponse, PriceRangeResponse, FeedbackResponse
+from fastapi import APIRouter, Query, Depends, HTTPException
+from typing import Any, Dict, List
+from ...domain.entities.product import Product, ProductResponse, PriceRangeResponse, FeedbackResponse, SupplierIDs
 from ...domain.use_cases.search_products import SearchProductsUseCase
 from ...domain.use_cases.search_products_by_link import SearchProductsByLinkUseCase
 from ...domain.use_cases.price_range import PriceRangeUseCase
@@ -7,12 +8,16 @@ from ...domain.use_cases.fetch_feedbacks import FetchFeedbacksUseCase
 from ...domain.use_cases.fetch_products_by_supplier import FetchProductsBySupplierUseCase
 from ...domain.use_cases.fetch_ids_by_supplier import FetchIDsBySupplierUseCase
 from ...dependencies import get_search_use_case, get_search_by_link_use_case, get_price_range_use_case, get_fetch_feedbacks_use_case, get_fetch_products_by_supplier_use_case, get_fetch_ids_by_supplier_use_case
+from .responses import MsgspecJSONResponse, msgspec_responses
+from operator import attrgetter
+import asyncio
+import heapq
 import logging
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-@router.get("/search", response_model=ProductResponse)
+@router.get("/search", responses=msgspec_responses(ProductResponse))
 async def search_products(
     query: str = Query(..., description="Поисковый запрос"),
     sort: str = Query("cheap", description="Сортировка: 'cheap' или 'expensive'"),
@@ -21,27 +26,29 @@ async def search_products(
 ):
     logger.info(f"Processing search query: {query}, sort: {sort}, pages: {pages}")
     products = await use_case.execute(query, sort, pages)
-    return ProductResponse(count=len(products), products=products)
+    return MsgspecJSONResponse(ProductResponse(count=len(products), products=products))
 
-@router.get("/top_products", response_model=dict)
+@router.get("/top_products", responses=msgspec_responses(Dict[str, List[Product]]))
 async def top_products(
     query: str = Query(..., description="Поисковый запрос"),
     pages: int = Query(3, description="Количество страниц для анализа"),
     use_case: SearchProductsUseCase = Depends(get_search_use_case)
 ):
     logger.info(f"Processing top products query: {query}, pages: {pages}")
-    expensive_products = await use_case.execute(query, "expensive", pages)
-    cheap_products = await use_case.execute(query, "cheap", pages)
+    expensive_products, cheap_products = await asyncio.gather(
+        use_case.execute(query, "expensive", pages),
+        use_case.execute(query, "cheap", pages)
+    )
 
-    top_expensive = sorted(expensive_products, key=lambda x: x.rating, reverse=True)[:3]
-    top_cheap = sorted(cheap_products, key=lambda x: x.rating, reverse=True)[:3]
+    top_expensive = heapq.nlargest(3, expensive_products, key=attrgetter("rating"))
+    top_cheap = heapq.nlargest(3, cheap_products, key=attrgetter("rating"))
 
-    return {
+    return MsgspecJSONResponse({
         "top_expensive": top_expensive,
         "top_cheap": top_cheap
-    }
+    })
 
-@router.get("/product_by_link", response_model=dict)
+@router.get("/product_by_link", responses=msgspec_responses(Dict[str, Any]))
 async def product_by_link(
     link: str = Query(..., description="Ссылка на товар Wildberries"),
     pages: int = Query(3, description="Количество страниц для поиска аналогов"),
@@ -49,38 +56,41 @@ async def product_by_link(
 ):
     logger.info(f"Processing product by link: {link}, pages: {pages}")
     result = await use_case.execute(link, pages)
-    return result
+    return MsgspecJSONResponse(result)
 
-@router.get("/price_range", response_model=PriceRangeResponse)
+@router.get("/price_range", responses=msgspec_responses(PriceRangeResponse))
 async def price_range(
     query: str = Query(..., description="Поисковый запрос"),
     pages: int = Query(3, description="Количество страниц для анализа"),
     use_case: PriceRangeUseCase = Depends(get_price_range_use_case)
 ):
     logger.info(f"Processing price range query: {query}, pages: {pages}")
-    return await use_case.execute(query, pages)
+    return MsgspecJSONResponse(await use_case.execute(query, pages))
 
-@router.get("/feedbacks", response_model=FeedbackResponse)
+@router.get("/feedbacks", responses=msgspec_responses(FeedbackResponse))
 async def get_feedbacks(
     link: str = Query(..., description="Ссылка на товар Wildberries"),
     use_case: FetchFeedbacksUseCase = Depends(get_fetch_feedbacks_use_case)
 ):
     logger.info(f"Processing feedbacks for link: {link}")
-    return await use_case.execute(link)
+    return MsgspecJSONResponse(await use_case.execute(link))
 
-@router.get("/products_by_supplier", response_model=ProductResponse)
+@router.get("/products_by_supplier", responses=msgspec_responses(ProductResponse))
 async def get_products_by_supplier(
     supplier_id: int = Query(..., description="ID продавца"),
     pages: int = Query(3, description="Количество страниц для анализа"),
     use_case: FetchProductsBySupplierUseCase = Depends(get_fetch_products_by_supplier_use_case)
 ):
     logger.info(f"Processing products for supplier_id: {supplier_id}, pages: {pages}")
-    return await use_case.execute(supplier_id, pages)
+    return MsgspecJSONResponse(await use_case.execute(supplier_id, pages))
 
-@router.get("/supplier_ids_by_brand", response_model=dict)
+@router.get("/supplier_ids_by_brand", responses=msgspec_responses(SupplierIDs))
 async def get_supplier_ids_by_brand(
     brand_url: str = Query(..., description="Ссылка на бренд Wildberries"),
     use_case: FetchIDsBySupplierUseCase = Depends(get_fetch_ids_by_supplier_use_case)
 ):
     logger.info(f"Processing supplier IDs for brand URL: {brand_url}")
-    return await use_case.execute(brand_url)
\ No newline at end of file
+    supplier_ids = await use_case.execute(brand_url)
+    if supplier_ids is None:
+        raise HTTPException(status_code=404, detail=f"Supplier IDs not found for brand URL: {brand_url}")
+    return MsgspecJSONResponse(supplier_ids)
\ No newline at end of file